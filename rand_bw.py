@@ -1,15 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
 import random
+import queue
+import threading
 import time
-from typing import Callable, Tuple
-import math
-import random
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+from PIL import Image, ImageTk
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python loops
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # ==================== CONFIGURATION ====================
 GRID_W, GRID_H = 120, 120
 PIXEL = 5
 ANIMATION_SPEED = 0.8  # seconds for full animation
+GEN_CACHE_SIZE = 16  # generated grids kept per (algorithm, seed)
 
 # Sophisticated color palette - Scientific Elegance
 COLORS = {
@@ -74,54 +85,157 @@ def multiply_with_carry(s: int) -> Tuple[int, int]:
     x = s & 0xFFFFFFFF
     result = (a * x + c) & 0xFFFFFFFFFFFFFFFF
     return result, 0xFFFFFFFFFFFFFFFF
+
+# ==================== BATCH GENERATORS ====================
+# Each batch function returns (values, mod). For the recurrence-backed generators,
+# values holds the first n states produced from the seed, identical to calling the
+# scalar version n times. The counter-based xorshift_block_batch is the exception.
+
+def _affine_batch(x0: int, a: int, c: int, m: int, n: int) -> np.ndarray:
+    """Expand x -> (a*x + c) % m into n states by leapfrog doubling"""
+    out = np.empty(n, dtype=np.int64)
+    out[0] = x0
+    filled = 1
+    step_a, step_c = a % m, c % m  # map that advances `filled` steps
+    while filled < n:
+        count = min(filled, n - filled)
+        out[filled:filled + count] = (step_a * out[:count] + step_c) % m
+        step_a, step_c = (step_a * step_a) % m, (step_a * step_c + step_c) % m
+        filled += count
+    return out
+
+def lcg_batch(seed: int, n: int) -> Tuple[np.ndarray, int]:
+    """Vectorized Linear Congruential Generator"""
+    x0, mod = lcg(seed)
+    return _affine_batch(x0, 9301, 49297, mod, n), mod
+
+def park_miller_batch(seed: int, n: int) -> Tuple[np.ndarray, int]:
+    """Vectorized Park-Miller generator"""
+    x0, mod = park_miller(seed)
+    return _affine_batch(x0, 16807, 0, mod, n), mod
+
+# Xorshift shifts and mask, typed once so no expression mixes Python ints with uint32
+_XS_A, _XS_B, _XS_C = np.uint32(13), np.uint32(17), np.uint32(5)
+_XS_MASK = np.uint32(0xFFFFFFFF)
+
+# murmur3 fmix32 finalizer constants for the counter-based block variant
+_FMIX_M1, _FMIX_M2 = np.uint32(0x85EBCA6B), np.uint32(0xC2B2AE35)
+_FMIX_R1, _FMIX_R2 = np.uint32(16), np.uint32(13)
+
+@njit(cache=True)
+def _xorshift_fill(seed, out):
+    # Masks keep the state in 32 bits even if Numba widens intermediates
+    s = np.uint32(seed)
+    for i in range(out.size):
+        s ^= (s << _XS_A) & _XS_MASK
+        s ^= (s >> _XS_B)
+        s ^= (s << _XS_C) & _XS_MASK
+        out[i] = s
+
+def xorshift_batch(seed: int, n: int) -> Tuple[np.ndarray, int]:
+    """Xorshift states filled by a compiled loop"""
+    x0, mod = xorshift(seed)
+    out = np.empty(n, dtype=np.uint32)
+    out[0] = x0
+    _xorshift_fill(x0, out[1:])
+    return out, mod
+
+def xorshift_block_batch(seed: int, n: int) -> Tuple[np.ndarray, int]:
+    """Counter-based generator: hash seed + i independently per position"""
+    # Not the xorshift recurrence (no state carried between cells), which lets
+    # the whole grid compute as a few vectorized uint32 ops. A single xorshift
+    # round barely separates neighbouring counters, so the counter goes through
+    # the murmur3 fmix32 xorshift-multiply finalizer instead (uint32 wraps).
+    s = np.arange(n, dtype=np.uint32) + np.uint32(seed & 0xFFFFFFFF)
+    s ^= s >> _FMIX_R1
+    s *= _FMIX_M1
+    s ^= s >> _FMIX_R2
+    s *= _FMIX_M2
+    s ^= s >> _FMIX_R1
+    return s, 0xFFFFFFFF
+
+@njit(cache=True)
+def _multiply_with_carry_fill(seed, out):
+    # a * x + c stays below 2**64, so native uint64 math matches the bignum result
+    s = np.uint64(seed)
+    a = np.uint64(4294957665)
+    for i in range(out.size):
+        x = s & np.uint64(0xFFFFFFFF)
+        c = s >> np.uint64(32)
+        s = a * x + c
+        out[i] = s
+
+def multiply_with_carry_batch(seed: int, n: int) -> Tuple[np.ndarray, int]:
+    """Multiply-with-carry states filled by a compiled loop"""
+    x0, mod = multiply_with_carry(seed)
+    out = np.empty(n, dtype=np.uint64)
+    out[0] = x0
+    _multiply_with_carry_fill(np.uint64(x0), out[1:])
+    return out, mod
     
 ALGORITHMS = {
     "Linear Congruential (LCG)": {
-        "func": lcg,
+        "batch": lcg_batch,
         "desc": "Classic PRNG used in many systems",
         "color": "#00d4ff"
     },
     "Park-Miller": {
-        "func": park_miller,
+        "batch": park_miller_batch,
         "desc": "Minimal standard, good statistical properties",
         "color": "#00ff88"
     },
     "Xorshift": {
-        "func": xorshift,
+        "batch": xorshift_batch,
         "desc": "Fast bitwise operation-based generator",
         "color": "#ffaa00"
     },
+    "Xorshift (block)": {
+        "batch": xorshift_block_batch,
+        "desc": "Hashed counter (fmix32), fully vectorized",
+        "color": "#b388ff"
+    },
     "Multiply-with-Carry": {
-        "func": multiply_with_carry,
+        "batch": multiply_with_carry_batch,
         "desc": "High-quality long-period generator",
         "color": "#ff4466"
     }
 }
 
+# Subtle accent tint (10% of the algorithm color) mixed into every pixel
+for data in ALGORITHMS.values():
+    data["tint"] = tuple(int(data["color"][i:i + 2], 16) * 0.1 for i in (1, 3, 5))
+
 # ==================== UTILITY FUNCTIONS ====================
-def value_to_color(v: int, mod: int, algorithm_color: str) -> str:
-    """Convert RNG value to sophisticated grayscale with subtle accent tint"""
-    ratio = v / mod
-    base_gray = int(ratio * 200 + 20)
-    
-    # Add subtle color tint based on algorithm
-    r = int(int(algorithm_color[1:3], 16) * 0.1 + base_gray * 0.9)
-    g = int(int(algorithm_color[3:5], 16) * 0.1 + base_gray * 0.9)
-    b = int(int(algorithm_color[5:7], 16) * 0.1 + base_gray * 0.9)
+def gray_levels(values: np.ndarray, mod: int) -> np.ndarray:
+    """Map RNG values onto gray levels 0..200 using integer math"""
+    # Drop low bits of wide moduli so (v >> shift) * 200 stays within 64 bits
+    shift = max(0, mod.bit_length() - 32)
+    return ((values >> shift).astype(np.int64) * 200) // (mod >> shift)
+
+def color_lut(tint: Tuple[float, float, float]) -> np.ndarray:
+    """Sophisticated grayscale with subtle accent tint, one RGB triple per gray level"""
+    base_gray = np.arange(201) + 20
+    rgb = np.array(tint) + base_gray[:, None] * 0.9
     
-    return f"#{min(r, 255):02x}{min(g, 255):02x}{min(b, 255):02x}"
+    return np.minimum(rgb, 255).astype(np.uint8)
 
 def ease_out_cubic(t: float) -> float:
     """Cubic ease-out for smooth animations"""
-    return 1 - pow(1 - t, 3)
+    u = 1 - t
+    return 1 - u * u * u
 
 def ease_in_out_quart(t: float) -> float:
     """Quartic ease-in-out for button animations"""
-    return 4 * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 4) / 2
+    if t < 0.5:
+        return 4 * t * t * t
+    u = -2 * t + 2
+    u2 = u * u
+    return 1 - u2 * u2 * 0.5
 
-def draw_rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
-    """Draw a rounded rectangle on canvas"""
-    points = [
+@lru_cache(maxsize=32)
+def _rounded_points(x1, y1, x2, y2, radius):
+    """Control points for a smoothed rounded rectangle (cached per geometry)"""
+    return (
         x1 + radius, y1,
         x2 - radius, y1,
         x2, y1,
@@ -134,8 +248,11 @@ def draw_rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
         x1, y2 - radius,
         x1, y1 + radius,
         x1, y1
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
+    )
+
+def draw_rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
+    """Draw a rounded rectangle on canvas"""
+    return canvas.create_polygon(*_rounded_points(x1, y1, x2, y2, radius), smooth=True, **kwargs)
 
 # ==================== MAIN APPLICATION ====================
 class RNGVisualizerPro:
@@ -144,6 +261,8 @@ class RNGVisualizerPro:
         self.current_algorithm = tk.StringVar(value="Linear Congruential (LCG)")
         self.is_generating = False
         self.animation_id = None
+        self.algo_options = {}
+        self._gen_cache = {}  # (algo_name, seed) -> (image, stats), oldest first
         
         self._setup_window()
         self._create_layout()
@@ -285,7 +404,7 @@ class RNGVisualizerPro:
         )
         
         # Color indicator
-        option_canvas.create_rectangle(
+        strip = option_canvas.create_rectangle(
             0, 0, 4, 70,
             fill=data["color"],
             outline=""
@@ -313,42 +432,28 @@ class RNGVisualizerPro:
             self.current_algorithm.set(name)
             self._refresh_algorithm_selector()
         
-        def on_enter(e):
+        def on_enter():
             option_canvas.itemconfig(rect, fill=COLORS["surface"])
             option_canvas.configure(cursor="hand2")
         
-        def on_leave(e):
+        def on_leave():
             bg = COLORS["surface"] if self.current_algorithm.get() == name else COLORS["bg_tertiary"]
             option_canvas.itemconfig(rect, fill=bg)
             option_canvas.configure(cursor="")
         
         option_canvas.bind("<Button-1>", on_click)
-        option_canvas.bind("<Enter>", on_enter)
-        option_canvas.bind("<Leave>", on_leave)
+        self._bind_hover(option_canvas, on_enter, on_leave)
         
-        # Store reference
-        option_canvas.algo_name = name
+        # Store references; items persist for the canvas lifetime, only styling changes
+        option_canvas.items = {"rect": rect, "strip": strip, "title": title_text, "desc": desc_text}
+        self.algo_options[name] = option_canvas
         
     def _refresh_algorithm_selector(self):
         """Refresh algorithm selector appearance"""
-        for widget in self.sidebar.winfo_children():
-            if isinstance(widget, tk.Frame):
-                for canvas in widget.winfo_children():
-                    if isinstance(canvas, tk.Canvas) and hasattr(canvas, 'algo_name'):
-                        selected = canvas.algo_name == self.current_algorithm.get()
-                        # This is simplified - in production you'd store item IDs
-                        canvas.delete("all")
-                        self._redraw_algorithm_option(canvas, canvas.algo_name, selected)
-    
-    def _redraw_algorithm_option(self, canvas, name, selected):
-        """Redraw algorithm option"""
-        data = ALGORITHMS[name]
-        bg_color = COLORS["surface"] if selected else COLORS["bg_tertiary"]
-        
-        draw_rounded_rect(canvas, 0, 0, 272, 70, 12, fill=bg_color, outline="")
-        canvas.create_rectangle(0, 0, 4, 70, fill=data["color"], outline="")
-        canvas.create_text(20, 22, text=name, anchor="w", fill=COLORS["text_primary"], font=FONT_BODY)
-        canvas.create_text(20, 48, text=data["desc"], anchor="w", fill=COLORS["text_tertiary"], font=FONT_SMALL)
+        selected = self.current_algorithm.get()
+        for name, canvas in self.algo_options.items():
+            bg_color = COLORS["surface"] if name == selected else COLORS["bg_tertiary"]
+            canvas.itemconfig(canvas.items["rect"], fill=bg_color)
         
     def _create_seed_input(self):
         """Create seed input field"""
@@ -408,21 +513,10 @@ class RNGVisualizerPro:
         
         self.gen_button_canvas.pack(fill="x")
         
-        self._draw_generate_button(COLORS["accent_primary"])
-        
-        self.gen_button_canvas.bind("<Button-1>", lambda e: self.generate_visualization())
-        self.gen_button_canvas.bind("<Enter>", lambda e: self._draw_generate_button(COLORS["accent_glow"]))
-        self.gen_button_canvas.bind("<Leave>", lambda e: self._draw_generate_button(COLORS["accent_primary"]))
-        self.gen_button_canvas.configure(cursor="hand2")
-    
-    def _draw_generate_button(self, color):
-        """Draw generate button"""
-        self.gen_button_canvas.delete("all")
-        
-        draw_rounded_rect(
+        self.gen_button_rect = draw_rounded_rect(
             self.gen_button_canvas,
             0, 0, 272, 56, 14,
-            fill=color,
+            fill=COLORS["accent_primary"],
             outline=""
         )
         
@@ -433,6 +527,18 @@ class RNGVisualizerPro:
             font=FONT_TITLE
         )
         
+        self.gen_button_canvas.bind("<Button-1>", lambda e: self.generate_visualization())
+        self._bind_hover(
+            self.gen_button_canvas,
+            lambda: self._set_generate_button_color(COLORS["accent_glow"]),
+            lambda: self._set_generate_button_color(COLORS["accent_primary"])
+        )
+        self.gen_button_canvas.configure(cursor="hand2")
+    
+    def _set_generate_button_color(self, color):
+        """Recolor generate button"""
+        self.gen_button_canvas.itemconfig(self.gen_button_rect, fill=color)
+        
     def _create_quick_actions(self, parent):
         """Create quick action buttons (right panel)"""
         tk.Label(
@@ -448,6 +554,7 @@ class RNGVisualizerPro:
     
         self._create_action_button(actions_frame, "Random Seed", self._randomize_seed)
         self._create_action_button(actions_frame, "Clear Grid", self._clear_grid)
+        self._create_action_button(actions_frame, "Toggle Grid Lines", self._toggle_grid_overlay)
 
         
     def _create_action_button(self, parent, text, command):
@@ -476,17 +583,33 @@ class RNGVisualizerPro:
         def on_click(e):
             command()
         
-        def on_enter(e):
+        def on_enter():
             btn_canvas.itemconfig(rect, fill=COLORS["surface"])
             btn_canvas.configure(cursor="hand2")
         
-        def on_leave(e):
+        def on_leave():
             btn_canvas.itemconfig(rect, fill=COLORS["bg_tertiary"])
             btn_canvas.configure(cursor="")
         
         btn_canvas.bind("<Button-1>", on_click)
-        btn_canvas.bind("<Enter>", on_enter)
-        btn_canvas.bind("<Leave>", on_leave)
+        self._bind_hover(btn_canvas, on_enter, on_leave)
+    
+    def _bind_hover(self, canvas, on_enter, on_leave):
+        """Bind hover handlers, coalescing bursts of Enter/Leave into one repaint"""
+        canvas._hover_state = False
+        canvas._pending_hover = None
+        
+        def apply_hover():
+            canvas._pending_hover = None
+            (on_enter if canvas._hover_state else on_leave)()
+        
+        def schedule(hovered):
+            canvas._hover_state = hovered
+            if canvas._pending_hover is None:
+                canvas._pending_hover = canvas.after_idle(apply_hover)
+        
+        canvas.bind("<Enter>", lambda e: schedule(True))
+        canvas.bind("<Leave>", lambda e: schedule(False))
     
     # ==================== VISUALIZATION AREA ====================
     def _create_visualization_area(self):
@@ -495,22 +618,21 @@ class RNGVisualizerPro:
         viz_container = tk.Frame(self.main_area, bg=COLORS["bg_primary"])
         viz_container.pack(expand=True, fill="both", padx=40, pady=40)
         
-        # Canvas card
+        # Card background (bottom layer, drawn once)
         canvas_width = GRID_W * PIXEL + 60
         canvas_height = GRID_H * PIXEL + 60
         
-        self.viz_card = tk.Canvas(
+        self.bg_card = tk.Canvas(
             viz_container,
             width=canvas_width,
             height=canvas_height,
             bg=COLORS["bg_primary"],
             highlightthickness=0
         )
-        self.viz_card.pack()
+        self.bg_card.pack()
         
-        # Card background
         draw_rounded_rect(
-            self.viz_card,
+            self.bg_card,
             0, 0,
             canvas_width, canvas_height,
             24,
@@ -518,21 +640,24 @@ class RNGVisualizerPro:
             outline=""
         )
         
-        # Grid canvas
+        # Grid canvas (top layer, the only one repainted on generate/clear)
         self.grid_canvas = tk.Canvas(
-            self.viz_card,
+            viz_container,
             width=GRID_W * PIXEL,
             height=GRID_H * PIXEL,
             bg=COLORS["bg_tertiary"],
             highlightthickness=0
         )
+        self.grid_canvas.place(in_=self.bg_card, x=30, y=30)
         
-        self.viz_card.create_window(
-            30, 30,
-            anchor="nw",
-            window=self.grid_canvas
+        # Single image backing the whole grid (one canvas item instead of one per cell)
+        self.grid_image = ImageTk.PhotoImage("RGB", (GRID_W * PIXEL, GRID_H * PIXEL))
+        self.grid_image_id = self.grid_canvas.create_image(
+            0, 0, anchor="nw", image=self.grid_image, state="hidden"
         )
         
+        self._create_grid_overlay()
+        
         # Status label
         self.status_label = tk.Label(
             viz_container,
@@ -543,6 +668,21 @@ class RNGVisualizerPro:
         )
         self.status_label.pack(pady=15)
         
+    def _create_grid_overlay(self):
+        """Pre-render cell outlines once as a transparent image above the grid"""
+        width, height = GRID_W * PIXEL, GRID_H * PIXEL
+        self.grid_overlay = tk.PhotoImage(width=width, height=height)
+        
+        # Unwritten pixels stay transparent; each put tiles one color along a line
+        for x in range(0, width, PIXEL):
+            self.grid_overlay.put(COLORS["divider"], to=(x, 0, x + 1, height))
+        for y in range(0, height, PIXEL):
+            self.grid_overlay.put(COLORS["divider"], to=(0, y, width, y + 1))
+        
+        self.grid_overlay_id = self.grid_canvas.create_image(
+            0, 0, anchor="nw", image=self.grid_overlay, state="hidden"
+        )
+        
     # ==================== STATS PANEL ====================
     def _create_stats_panel(self):
         """Create statistics panel"""
@@ -623,8 +763,6 @@ class RNGVisualizerPro:
         
         # Get algorithm
         algo_name = self.current_algorithm.get()
-        algo_func = ALGORITHMS[algo_name]["func"]
-        algo_color = ALGORITHMS[algo_name]["color"]
         
         # Get seed
         try:
@@ -634,37 +772,74 @@ class RNGVisualizerPro:
             self.seed_entry.delete(0, tk.END)
             self.seed_entry.insert(0, str(seed))
         
-        # Clear grid
-        self.grid_canvas.delete("all")
+        # Same parameters as a recent run: reuse its output
+        key = (algo_name, seed)
+        if key in self._gen_cache:
+            self.is_generating = False
+            self._apply_grid(algo_name, *self._gen_cache[key], 0.0)
+            return
+        
+        # Compute off the Tk thread; results come back through the queue
+        results = queue.Queue(maxsize=1)
+        
+        def worker():
+            try:
+                results.put(self._compute_grid(algo_name, seed))
+            except Exception as exc:
+                results.put(exc)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self._poll_generation(results, key)
+    
+    def _compute_grid(self, algo_name, seed):
+        """Run the RNG and coloring pipeline (no Tk calls, safe off the main thread)"""
+        start_time = time.time()
+        algo = ALGORITHMS[algo_name]
+        
+        values, mod = algo["batch"](seed, GRID_W * GRID_H)
+        stats = (int(values[-1]), int(values.min()), int(values.max()))
+        
+        rgb = color_lut(algo["tint"])[gray_levels(values, mod)]
+        image = Image.frombuffer(
+            "RGB", (GRID_W, GRID_H), rgb.tobytes(), "raw", "RGB", 0, 1
+        ).resize((GRID_W * PIXEL, GRID_H * PIXEL), Image.NEAREST)
+        
+        return image, stats, time.time() - start_time
+    
+    def _poll_generation(self, results, key):
+        """Wait for the worker without blocking the event loop"""
+        try:
+            result = results.get_nowait()
+        except queue.Empty:
+            self.root.after(10, self._poll_generation, results, key)
+            return
+        
+        self.is_generating = False
+        if isinstance(result, Exception):
+            self.status_label.config(text=f"Generation failed: {result}", fg=COLORS["error"])
+            return
         
-        # Track stats
+        image, stats, compute_time = result
+        self._cache_grid(key, image, stats)
+        self._apply_grid(key[0], image, stats, compute_time)
+    
+    def _cache_grid(self, key, image, stats):
+        """Remember a generated grid, evicting the oldest beyond GEN_CACHE_SIZE"""
+        if len(self._gen_cache) >= GEN_CACHE_SIZE:
+            del self._gen_cache[next(iter(self._gen_cache))]
+        self._gen_cache[key] = (image, stats)
+    
+    def _apply_grid(self, algo_name, image, stats, compute_time):
+        """Blit computed image and update stats (Tk thread only)"""
         start_time = time.time()
-        min_val = float('inf')
-        max_val = 0
-        
-        # Generate grid
-        s = seed
-        last_value = s
-        
-        for y in range(GRID_H):
-            for x in range(GRID_W):
-                s, mod = algo_func(s)
-                last_value = s
-                
-                min_val = min(min_val, s)
-                max_val = max(max_val, s)
-                
-                color = value_to_color(s, mod, algo_color)
-                
-                self.grid_canvas.create_rectangle(
-                    x * PIXEL, y * PIXEL,
-                    (x + 1) * PIXEL, (y + 1) * PIXEL,
-                    fill=color,
-                    outline=""
-                )
+        
+        # Overwrite the displayed image in place with one bulk pixel copy
+        self.grid_image.paste(image)
+        self.grid_canvas.itemconfigure(self.grid_image_id, state="normal")
         
         # Update stats
-        gen_time = time.time() - start_time
+        last_value, min_val, max_val = stats
+        gen_time = compute_time + time.time() - start_time
         self._update_stat("Final Value", f"{last_value:,}")
         self._update_stat("Iterations", f"{GRID_W * GRID_H:,}")
         self._update_stat("Min Value", f"{min_val:,}")
@@ -675,8 +850,6 @@ class RNGVisualizerPro:
             text=f"Generated {GRID_W * GRID_H:,} values using {algo_name}",
             fg=COLORS["success"]
         )
-        
-        self.is_generating = False
     
     # ==================== QUICK ACTIONS ====================
     def _randomize_seed(self):
@@ -688,17 +861,15 @@ class RNGVisualizerPro:
     
     def _clear_grid(self):
         """Clear the visualization grid"""
-        self.grid_canvas.delete("all")
+        self.grid_canvas.itemconfigure(self.grid_image_id, state="hidden")
         for label in self.stats_items:
             self._update_stat(label, "—")
         self.status_label.config(text="Grid cleared", fg=COLORS["text_tertiary"])
     
-    def _export_data(self):
-        """Export visualization data"""
-        messagebox.showinfo(
-            "Export Data",
-            "Export functionality would save the current visualization\nand statistics to a file (CSV, PNG, or JSON)."
-        )
+    def _toggle_grid_overlay(self):
+        """Show or hide the cell outline overlay"""
+        hidden = self.grid_canvas.itemcget(self.grid_overlay_id, "state") == "hidden"
+        self.grid_canvas.itemconfigure(self.grid_overlay_id, state="normal" if hidden else "hidden")
     
     # ==================== KEY BINDINGS ====================
     def _setup_key_bindings(self):
@@ -706,6 +877,7 @@ class RNGVisualizerPro:
         self.root.bind("<Return>", lambda e: self.generate_visualization())
         self.root.bind("<Control-r>", lambda e: self._randomize_seed())
         self.root.bind("<Control-c>", lambda e: self._clear_grid())
+        self.root.bind("<Control-g>", lambda e: self._toggle_grid_overlay())
 
 
 # ==================== MAIN ====================